@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
 import datetime
-from supabase import create_client, Client
+from supabase import Client
 import plotly.express as px
-import calendar
 import time
+import unicodedata
+import calendar
+from tracker_core import (
+    create_supabase_client, fetch_table, insert_record, calculate_anniversary_details,
+    PERSONS, CATEGORY_MAP, build_transaction, build_todo, summarize_totals,
+    BASE_CURRENCY, load_fx_rates, fx_rates_version, import_fx_rates, missing_fx_rates, reporting_amounts,
+    format_amount, format_amounts, CALENDAR_TABLES, calendar_events, DateIntervalIndex,
+)
 
 # -------------------------------
 # Page Configuration
@@ -121,41 +128,19 @@ if not check_password():
 # Supabase Setup
 # -------------------------------
 try:
-    supabase_url = st.secrets["supabase"]["url"]
-    supabase_key = st.secrets["supabase"]["key"]
-    supabase: Client = create_client(supabase_url, supabase_key)
+    supabase: Client = create_supabase_client(st.secrets)
 except (KeyError, FileNotFoundError):
     st.error("Supabase credentials not found.")
     st.info("Please add Supabase URL and Key to Streamlit secrets.")
     st.stop()
 
-# -------------------------------
-# Category Mapping (for Finances)
-# -------------------------------
-CATEGORY_MAP = {
-    "Income": {"Salary": ["-"], "Returns": ["-"], "Others": ["-"]},
-    "Expense": {
-        "Deductions": ["Home Loan", "Interiors Loan", "Home Insurance", "Others"],
-        "Entertainment": ["Movies", "Music", "Others"], "Investments": ["Stock", "Mutual Funds", "NPS", "Gold", "Others"],
-        "Savings": ["Emergency Fund", "Short-Vacation", "Long-Vacation", "Dates"],
-        "Insurance": ["Health", "Bike", "Car", "Home", "Others"], "Groceries": ["Instamart", "Offline", "Others"],
-        "Shopping": ["Clothes", "Electronics", "Others"],
-        "Bills": ["Rent", "Mobile", "Internet", "Electricity", "Gas", "Home Maintenance", "Credit Card", "Others"],
-        "Travel": ["Petrol", "Cab", "Others"], "Vacation": ["Travel", "Food", "Accomomdation", "Others"],
-        "Medical": ["Pharmacy", "Tests", "Others"],"Food": ["Restaurant", "Home Delivery", "Office", "Others"],
-        "Others": ["-"],
-    },
-}
-
 # -------------------------------
 # Formatting Functions
 # -------------------------------
-def format_amount(amount):
-    return f"₹{amount:,.1f}"
-
 def parse_amount(value):
     try:
-        return float(str(value).replace(",", "").replace("₹", ""))
+        # Drop only currency symbols, spaces and thousands separators; float() rejects the rest
+        return float("".join(c for c in str(value) if c != "," and not c.isspace() and unicodedata.category(c) != "Sc"))
     except (ValueError, TypeError):
         return 0.0
 
@@ -163,23 +148,53 @@ def parse_amount(value):
 # SUPABASE CRUD FUNCTIONS
 # ===============================
 @st.cache_data(ttl=300)
-def get_all_data(table_name):
+def fetch_all_data(table_name):
+    """Returns the table and the time it was fetched, which versions every cache derived from it."""
     try:
-        response = supabase.table(table_name).select("*").order("created_at", desc=True).execute()
-        df = pd.DataFrame(response.data)
-        for col in ['date', 'due_date', 'reminder_date', 'event_date', 'start_date', 'end_date']:
-             if col in df.columns:
-                 df[col] = pd.to_datetime(df[col], errors='coerce').dt.date
-        return df
+        return fetch_table(supabase, table_name), time.time()
     except Exception as e:
         st.error(f"Error fetching data from {table_name}: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), time.time()
+
+def get_all_data(table_name):
+    return fetch_all_data(table_name)[0]
+
+def get_data_version(table_name):
+    """Changes whenever `get_all_data(table_name)` is refetched, after a write here,
+    or when the 5-minute TTL picks up writes from elsewhere (e.g. the quick-capture API)."""
+    return fetch_all_data(table_name)[1]
+
+@st.cache_data(max_entries=4)
+def load_fx_rates_version(version):
+    return load_fx_rates()
+
+def get_fx_rates():
+    return load_fx_rates_version(fx_rates_version())
+
+def get_reporting_currency():
+    return st.session_state.get("reporting_currency", BASE_CURRENCY)
+
+def currency_options(rates, current=None):
+    """Currencies with an FX rate, keeping an existing record's `current` selectable."""
+    options = list(rates.index)
+    if current and current not in options:
+        options.append(current)
+    return options
+
+def get_item_currency(item):
+    """Currency of a fetched row, treating NULL as BASE_CURRENCY."""
+    currency = item['currency']
+    return currency if pd.notna(currency) else BASE_CURRENCY
+
+def warn_missing_rate(currency, rates):
+    if currency not in rates.index:
+        st.warning(f"No FX rate for {currency}; import one on the Currency Rates page or it is left out of the totals.")
 
 def add_record(table_name, data_dict):
     try:
-        supabase.table(table_name).insert(data_dict).execute()
+        insert_record(supabase, table_name, data_dict)
         st.success(f"✅ Record added to {table_name}!")
-        st.cache_data.clear()
+        fetch_all_data.clear()
     except Exception as e:
         st.error(f"Error adding record: {e}")
 
@@ -187,7 +202,7 @@ def update_record(table_name, record_id, data_dict):
     try:
         supabase.table(table_name).update(data_dict).eq("id", record_id).execute()
         st.success(f"✅ Record updated in {table_name}!")
-        st.cache_data.clear()
+        fetch_all_data.clear()
     except Exception as e:
         st.error(f"Error updating record: {e}")
 
@@ -195,75 +210,89 @@ def delete_record(table_name, record_id):
     try:
         supabase.table(table_name).delete().eq("id", record_id).execute()
         st.success(f"✅ Record deleted from {table_name}!")
-        st.cache_data.clear()
+        fetch_all_data.clear()
     except Exception as e:
         st.error(f"Error deleting record: {e}")
 
 def update_todo_status(todo_id, new_status):
     try:
         supabase.table("todos").update({"is_complete": new_status}).eq("id", todo_id).execute()
-        st.cache_data.clear()
+        fetch_all_data.clear()
     except Exception as e:
         st.error(f"Error updating To-Do status: {e}")
 
 # ===============================
-# HELPER FUNCTIONS FOR HOME PAGE
+# CACHED SUMMARY BUILDERS
 # ===============================
-def get_relativedelta_text(start_date, end_date):
-    """Calculates years, months, days between two dates and returns a formatted string."""
-    if start_date > end_date:
-        return "In the past"
-
-    years = end_date.year - start_date.year
-    months = end_date.month - start_date.month
-    days = end_date.day - start_date.day
-
-    if days < 0:
-        months -= 1
-        prev_month_year = end_date.year if end_date.month > 1 else end_date.year - 1
-        prev_month = end_date.month - 1 if end_date.month > 1 else 12
-        days += calendar.monthrange(prev_month_year, prev_month)[1]
-    
-    if months < 0:
-        years -= 1
-        months += 12
-    
-    parts = []
-    if years > 0: parts.append(f"{years}y")
-    if months > 0: parts.append(f"{months}m")
-    if days > 0 or not parts: parts.append(f"{days}d")
-        
-    return ", ".join(parts)
+SUMMARY_CACHE_SIZE = 32
 
-def calculate_anniversary_details(event_date):
-    """Calculates age and time to next anniversary for a given date."""
-    if pd.isnull(event_date):
-        return None, None
+@st.cache_data(max_entries=SUMMARY_CACHE_SIZE)
+def build_person_summary(data_version, person, reporting_currency=BASE_CURRENCY, ttype="Expense"):
+    """Builds totals, per-category sums and the details table for one person.
 
-    today = datetime.date.today()
-    if not isinstance(event_date, datetime.date):
-        event_date = pd.to_datetime(event_date).date()
+    Amounts are converted to `reporting_currency` with the local FX table first.
 
-    # 1. Time passed since original event
-    time_passed_str = get_relativedelta_text(event_date, today)
+    Keyed by the (transactions, fx_rates) data versions, so reruns reuse the pandas
+    work until the table is refetched or the rates change; `max_entries` evicts least
+    recently used. No TTL of its own: get_all_data's is the only one.
+    Returns None when the person has no transactions.
+    """
+    df = get_all_data("transactions")
+    if df.empty:
+        return None
+    df_person = df[df["person"] == person]
+    if df_person.empty:
+        return None
+
+    amounts = reporting_amounts(df_person, get_fx_rates(), reporting_currency)
+    totals = {
+        "income": amounts[df_person["type"] == "Income"].sum(),
+        "expense": amounts[df_person["type"] == "Expense"].sum(),
+    }
 
-    # 2. Find next occurrence
-    next_occurrence_year = today.year
-    if (today.month, today.day) > (event_date.month, event_date.day):
-        next_occurrence_year += 1
-    
-    try:
-        next_event_date = event_date.replace(year=next_occurrence_year)
-    except ValueError: # Handle Feb 29 on non-leap years
-        next_event_date = datetime.date(next_occurrence_year, 2, 28)
+    df_filtered = df_person[df_person["type"] == ttype].assign(amount=amounts)
+    if df_filtered.empty:
+        return totals, None, None
+
+    by_category = df_filtered.groupby('category')['amount'].sum().reset_index()
+    details = df_filtered.groupby(['category', 'sub_category'])['amount'].sum().reset_index().sort_values(by='amount', ascending=False)
+    details['Amount'] = format_amounts(details['amount'], reporting_currency)
+    return totals, by_category, details[['category', 'sub_category', 'Amount']]
+
+@st.cache_resource(max_entries=SUMMARY_CACHE_SIZE)
+def build_person_chart(data_version, person, reporting_currency=BASE_CURRENCY, ttype="Expense"):
+    """Pie chart of build_person_summary's category sums, under the same key.
+
+    Uses cache_resource so a hit returns the stored Figure rather than unpickling
+    a copy through plotly's validating constructor; treat it as read-only.
+    """
+    summary = build_person_summary(data_version, person, reporting_currency, ttype)
+    if summary is None or summary[1] is None:
+        return None
+    fig = px.pie(summary[1], names='category', values='amount', title=f'{ttype} by Category',
+                 hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
+    fig.update_layout(showlegend=False, height=300, margin=dict(l=10, r=10, t=30, b=10))
+    return fig
 
-    # 3. Time until next occurrence
-    if next_event_date == today:
-        time_to_next_str = "🎉 Today!"
-    else:
-        time_to_next_str = get_relativedelta_text(today, next_event_date)
-        
-    return time_passed_str, time_to_next_str
+# ===============================
+# CALENDAR INDEX
+# ===============================
+@st.cache_resource(max_entries=4)
+def get_calendar_index(data_versions):
+    """Interval index over every dated table, rebuilt only when one of them changes."""
+    return DateIntervalIndex(calendar_events({t: get_all_data(t) for t in CALENDAR_TABLES}))
+
+@st.cache_data(max_entries=SUMMARY_CACHE_SIZE)
+def get_calendar_window(data_versions, start, end):
+    return get_calendar_index(data_versions).query(start, end)
+
+def get_calendar_range(anchor, view):
+    """Returns the (start, end) dates shown for `anchor` in the Month or Week view."""
+    if view == "Week":
+        start = anchor - datetime.timedelta(days=anchor.weekday())
+        return start, start + datetime.timedelta(days=6)
+    start = anchor.replace(day=1)
+    return start, anchor.replace(day=calendar.monthrange(anchor.year, anchor.month)[1])
 
 # ===============================
 # PAGE DEFINITIONS
@@ -285,16 +314,19 @@ def page_home():
     if df.empty:
         st.info("No transactions yet. Click the button above to add one.")
     else:
-        df['amount'] = pd.to_numeric(df['amount'])
-        total_income = df[df["type"] == "Income"]["amount"].sum()
-        total_expense = df[df["type"] == "Expense"]["amount"].sum()
-        net_balance = total_income - total_expense
-        num_transactions = len(df)
+        rates, currency = get_fx_rates(), get_reporting_currency()
+        totals = summarize_totals(df, rates, currency)
+        total_income, total_expense = totals["income"], totals["expense"]
+        net_balance = totals["balance"]
+        num_transactions = totals["transactions"]
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Income", format_amount(total_income))
-        col2.metric("Total Expense", format_amount(total_expense), delta=format_amount(-total_expense))
-        col3.metric("Net Balance", format_amount(net_balance))
+        col1.metric("Total Income", format_amount(total_income, currency))
+        col2.metric("Total Expense", format_amount(total_expense, currency), delta=format_amount(-total_expense, currency))
+        col3.metric("Net Balance", format_amount(net_balance, currency))
         col4.metric("Total Transactions", num_transactions)
+        missing = missing_fx_rates(df, rates)
+        if missing:
+            st.warning(f"No FX rate for {', '.join(missing)}; those transactions are left out of the totals.")
 
     st.divider()
     
@@ -344,7 +376,7 @@ def page_add_transaction():
     col1, col2 = st.columns(2)
     with col1:
         date = st.date_input("Date", datetime.date.today())
-        person = st.selectbox("Person", ["Pramodh", "Manasa", "Ours"])
+        person = st.selectbox("Person", PERSONS)
         ttype = st.selectbox("Type", ["Expense", "Income"])
     with col2:
         categories = list(CATEGORY_MAP.get(ttype, {}).keys())
@@ -357,24 +389,18 @@ def page_add_transaction():
 
         desc_label = "Description (Mandatory for 'Others')" if category == "Others" else "Description"
         desc = st.text_input(desc_label)
-        amount_input = st.text_input("Amount", "0")
+        amount_col, currency_col = st.columns([0.7, 0.3])
+        amount_input = amount_col.text_input("Amount", "0")
+        currency = currency_col.selectbox("Currency", currency_options(get_fx_rates()), key="add_currency")
     
     if st.button("Add Transaction"):
-        if category == "Others" and not desc:
-            st.warning("Description is mandatory when 'Others' category is selected.")
+        try:
+            data = build_transaction(date, person, ttype, category, subcategory, desc, parse_amount(amount_input), currency, get_fx_rates().index)
+        except ValueError as e:
+            st.warning(str(e))
         else:
-            amount = parse_amount(amount_input)
-            if amount > 0:
-                final_subcategory = desc if category == "Others" else subcategory
-                data = {
-                    "date": date.isoformat(), "person": person, "type": ttype, 
-                    "category": category, "sub_category": final_subcategory, 
-                    "description": desc, "amount": round(amount, 2)
-                }
-                add_record("transactions", data)
-                st.rerun()
-            else:
-                st.warning("Amount must be greater than zero.")
+            add_record("transactions", data)
+            st.rerun()
 
 def page_update_transaction():
     st.header("✏️ Update / Delete Transaction")
@@ -383,7 +409,7 @@ def page_update_transaction():
         st.info("No transactions available.")
         return
 
-    st.dataframe(df[['id', 'date', 'person', 'category', 'description', 'amount']].head(20), use_container_width=True, hide_index=True)
+    st.dataframe(df[['id', 'date', 'person', 'category', 'description', 'amount', 'currency']].head(20), use_container_width=True, hide_index=True)
     st.divider()
 
     transaction_id = st.number_input("Enter Transaction ID to Edit/Delete", min_value=1, step=1, value=None)
@@ -395,7 +421,7 @@ def page_update_transaction():
             col1, col2 = st.columns(2)
             with col1:
                 date = st.date_input("Date", value=item['date'], key=f"date_{transaction_id}")
-                person = st.selectbox("Person", ["Pramodh", "Manasa", "Ours"], index=["Pramodh", "Manasa", "Ours"].index(item['person']), key=f"person_{transaction_id}")
+                person = st.selectbox("Person", PERSONS, index=PERSONS.index(item['person']), key=f"person_{transaction_id}")
                 ttype = st.selectbox("Type", ["Expense", "Income"], index=["Expense", "Income"].index(item['type']), key=f"type_{transaction_id}")
             with col2:
                 categories = list(CATEGORY_MAP.get(ttype, {}).keys())
@@ -410,26 +436,23 @@ def page_update_transaction():
 
                 desc_label = "Description (Mandatory for 'Others')" if category == "Others" else "Description"
                 desc = st.text_input(desc_label, value=item['description'], key=f"desc_{transaction_id}")
-                amount_input = st.text_input("Amount", value=str(item['amount']), key=f"amount_{transaction_id}")
+                amount_col, currency_col = st.columns([0.7, 0.3])
+                amount_input = amount_col.text_input("Amount", value=str(item['amount']), key=f"amount_{transaction_id}")
+                item_currency = get_item_currency(item)
+                currencies = currency_options(get_fx_rates(), item_currency)
+                currency = currency_col.selectbox("Currency", currencies, index=currencies.index(item_currency), key=f"currency_{transaction_id}")
+                warn_missing_rate(currency, get_fx_rates())
             
             update_col, delete_col = st.columns(2)
             with update_col:
                 if st.button("Update Transaction", key=f"upd_btn_{transaction_id}"):
-                    if category == "Others" and not desc:
-                        st.warning("Description is mandatory when 'Others' category is selected.")
+                    try:
+                        data = build_transaction(date, person, ttype, category, subcategory, desc, parse_amount(amount_input), currency, currencies)
+                    except ValueError as e:
+                        st.warning(str(e))
                     else:
-                        amount = parse_amount(amount_input)
-                        if amount > 0:
-                            final_subcategory = desc if category == "Others" else subcategory
-                            data = {
-                                "date": date.isoformat(), "person": person, "type": ttype, 
-                                "category": category, "sub_category": final_subcategory, 
-                                "description": desc, "amount": round(amount, 2)
-                            }
-                            update_record("transactions", transaction_id, data)
-                            st.rerun()
-                        else:
-                            st.warning("Amount must be greater than zero.")
+                        update_record("transactions", transaction_id, data)
+                        st.rerun()
             with delete_col:
                 if st.button("Delete Transaction", key=f"del_btn_{transaction_id}", type="primary"):
                     delete_record("transactions", transaction_id)
@@ -439,54 +462,118 @@ def page_update_transaction():
 
 def page_view_summary():
     st.header("📊 Expense Summaries")
-    df = get_all_data("transactions")
-    if df.empty:
+    if get_all_data("transactions").empty:
         st.info("No transactions to display.")
         return
 
-    df['amount'] = pd.to_numeric(df['amount'])
-    persons = ["Pramodh", "Manasa", "Ours"]
-    for p in persons:
+    currency = get_reporting_currency()
+    missing = missing_fx_rates(get_all_data("transactions"), get_fx_rates())
+    if missing:
+        st.warning(f"No FX rate for {', '.join(missing)}; those transactions are left out of the totals.")
+
+    data_version = (get_data_version("transactions"), fx_rates_version())
+    for p in PERSONS:
         st.subheader(f"👤 {p}'s Summary")
-        df_person = df[df["person"] == p]
-        if df_person.empty:
+        summary = build_person_summary(data_version, p, currency)
+        if summary is None:
             st.info(f"No transactions yet for {p}.")
         else:
-            total_income = df_person[df_person["type"] == "Income"]["amount"].sum()
-            total_expense = df_person[df_person["type"] == "Expense"]["amount"].sum()
+            totals, _, expense_details = summary
+            total_income, total_expense = totals["income"], totals["expense"]
             
             # ROW 1: Metrics
             metric_cols = st.columns(3)
-            metric_cols[0].metric("Total Income", format_amount(total_income))
-            metric_cols[1].metric("Total Expense", format_amount(total_expense))
-            metric_cols[2].metric("Balance", format_amount(total_income - total_expense))
+            metric_cols[0].metric("Total Income", format_amount(total_income, currency))
+            metric_cols[1].metric("Total Expense", format_amount(total_expense, currency))
+            metric_cols[2].metric("Balance", format_amount(total_income - total_expense, currency))
             
             # ROW 2: Chart and Table
-            df_expense = df_person[df_person["type"] == "Expense"]
-            if not df_expense.empty:
+            if expense_details is not None:
                 chart_col, table_col = st.columns([0.4, 0.6])
                 
                 with chart_col:
-                    expense_by_cat = df_expense.groupby('category')['amount'].sum().reset_index()
-                    fig = px.pie(expense_by_cat, names='category', values='amount', title='Expense by Category',
-                                 hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
-                    fig.update_layout(showlegend=False, height=300, margin=dict(l=10, r=10, t=30, b=10))
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(build_person_chart(data_version, p, currency), use_container_width=True)
                 
                 with table_col:
                     st.write("**Expense Details**")
-                    expense_details = df_expense.groupby(['category', 'sub_category'])['amount'].sum().reset_index().sort_values(by='amount', ascending=False)
-                    expense_details['Amount'] = expense_details['amount'].apply(format_amount)
-                    st.dataframe(
-                        expense_details[['category', 'sub_category', 'Amount']],
-                        hide_index=True,
-                        use_container_width=True
-                    )
+                    st.dataframe(expense_details, hide_index=True, use_container_width=True)
             else:
                  st.info("No expenses recorded for this person.")
 
         st.divider()
 
+def page_currency_rates():
+    st.header("💱 Currency Rates")
+    st.write(f"Rates are kept locally in `fx_rates.csv` (seeded from `fx_rates.default.csv`) as {BASE_CURRENCY} per unit of each currency.")
+    rates = get_fx_rates()
+
+    reporting_options = list(rates.index)
+    current = get_reporting_currency()
+    reporting_currency = st.selectbox(
+        "Reporting Currency", reporting_options,
+        index=reporting_options.index(current) if current in reporting_options else reporting_options.index(BASE_CURRENCY)
+    )
+    if reporting_currency != current:
+        st.session_state.reporting_currency = reporting_currency
+        st.rerun()
+
+    st.dataframe(rates.rename_axis("Currency").reset_index(name=f"{BASE_CURRENCY} per unit"), use_container_width=True, hide_index=True)
+    st.divider()
+
+    uploaded = st.file_uploader("Import rates (CSV with `currency` and `rate` columns)", type="csv")
+    if uploaded is not None and st.button("Import Rates"):
+        try:
+            import_fx_rates(uploaded)
+            st.success("✅ FX rates imported!")
+            st.rerun()
+        except ValueError as e:
+            st.error(f"Error importing rates: {e}")
+
+# --- CALENDAR PAGE ---
+def page_calendar():
+    st.header("📅 Calendar")
+    col1, col2 = st.columns([0.3, 0.7])
+    with col1:
+        anchor = st.date_input("Go to", datetime.date.today(), key="calendar_anchor")
+    with col2:
+        view = st.radio("View", ["Month", "Week"], horizontal=True, key="calendar_view")
+
+    start, end = get_calendar_range(anchor, view)
+    data_versions = tuple(get_data_version(t) for t in CALENDAR_TABLES)
+    events = get_calendar_window(data_versions, start, end)
+
+    # Spread multi-day events (trips) over each visible day they cover
+    by_day = {}
+    for row in events.itertuples():
+        day = max(row.start, start)
+        while day <= min(row.end, end):
+            by_day.setdefault(day, []).append(row)
+            day += datetime.timedelta(days=1)
+
+    st.subheader(f"{start.strftime('%d %b %Y')} – {end.strftime('%d %b %Y')}" if view == "Week" else anchor.strftime("%B %Y"))
+    header_cols = st.columns(7)
+    for col, name in zip(header_cols, calendar.day_abbr):
+        col.markdown(f"**{name}**")
+
+    today = datetime.date.today()
+    for week in calendar.Calendar().monthdatescalendar(anchor.year, anchor.month):
+        if view == "Week" and start not in week:
+            continue
+        for col, day in zip(st.columns(7), week):
+            if day.month != anchor.month and view == "Month":
+                col.write("")
+                continue
+            label = f"**:blue[{day.day}]**" if day == today else f"**{day.day}**"
+            lines = [label] + [f"{row.source.split()[0]} {row.title}" for row in by_day.get(day, [])]
+            col.markdown("  \n".join(lines))
+
+    st.divider()
+    st.subheader("Agenda")
+    if events.empty:
+        st.info("Nothing scheduled in this period.")
+    else:
+        st.dataframe(events[['start', 'end', 'source', 'title', 'detail']], use_container_width=True, hide_index=True)
+
 # --- TO-DO PAGE ---
 def page_todo():
     st.header("✅ To-Do List")
@@ -494,12 +581,16 @@ def page_todo():
         with st.form("add_todo_form"):
             item = st.text_input("To-Do Item")
             due_date = st.date_input("Complete by", value=None)
-            assigned_user = st.selectbox("Assign to", ["Pramodh", "Manasa", "Ours"])
+            assigned_user = st.selectbox("Assign to", PERSONS)
             submitted = st.form_submit_button("Add To-Do")
             if submitted and item:
-                data = {"item": item, "due_date": due_date.isoformat() if due_date else None, "assigned_user": assigned_user}
-                add_record("todos", data)
-                st.rerun()
+                try:
+                    data = build_todo(item, due_date, assigned_user)
+                except ValueError as e:
+                    st.warning(str(e))
+                else:
+                    add_record("todos", data)
+                    st.rerun()
 
     df_todos = get_all_data("todos")
     if not df_todos.empty:
@@ -525,7 +616,7 @@ def page_add_reminder():
     with st.form("add_reminder_form"):
         title = st.text_input("Reminder Title")
         reminder_date = st.date_input("Reminder Date")
-        assigned_user = st.selectbox("For", ["Pramodh", "Manasa", "Ours"])
+        assigned_user = st.selectbox("For", PERSONS)
         details = st.text_area("Details (optional)")
         submitted = st.form_submit_button("Add Reminder")
         if submitted and title:
@@ -552,7 +643,7 @@ def page_view_reminders():
             st.subheader(f"Editing Reminder ID: {item_id}")
             title = st.text_input("Title", value=item['title'])
             reminder_date = st.date_input("Date", value=item['reminder_date'])
-            assigned_user = st.selectbox("For", ["Pramodh", "Manasa", "Ours"], index=["Pramodh", "Manasa", "Ours"].index(item['assigned_user']))
+            assigned_user = st.selectbox("For", PERSONS, index=PERSONS.index(item['assigned_user']))
             details = st.text_area("Details", value=item['details'])
             
             update_col, delete_col = st.columns(2)
@@ -626,11 +717,12 @@ def page_add_travel():
         end_date = st.date_input("End Date")
         status = st.selectbox("Status", ["Planned", "Booked", "Completed"])
         budget = st.number_input("Budget (Optional)", min_value=0.0, format="%.2f")
+        currency = st.selectbox("Budget Currency", currency_options(get_fx_rates()))
         notes = st.text_area("Notes (Flight details, hotel, etc.)")
         submitted = st.form_submit_button("Add Trip")
         if submitted and destination:
             if start_date <= end_date:
-                data = {"destination": destination, "start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "status": status, "budget": budget, "notes": notes}
+                data = {"destination": destination, "start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "status": status, "budget": budget, "currency": currency, "notes": notes}
                 add_record("travel", data)
                 st.session_state.page = "Travel_View_&_Edit"
                 st.rerun()
@@ -644,7 +736,7 @@ def page_view_travel():
         st.info("No travel plans available.")
         return
 
-    st.dataframe(df[['id', 'destination', 'start_date', 'end_date', 'status', 'budget']], use_container_width=True, hide_index=True)
+    st.dataframe(df[['id', 'destination', 'start_date', 'end_date', 'status', 'budget', 'currency']], use_container_width=True, hide_index=True)
     st.divider()
 
     item_id = st.number_input("Enter Trip ID to Edit/Delete", min_value=1, step=1, value=None)
@@ -658,12 +750,16 @@ def page_view_travel():
             end_date = st.date_input("End Date", value=item['end_date'])
             status = st.selectbox("Status", ["Planned", "Booked", "Completed"], index=["Planned", "Booked", "Completed"].index(item['status']))
             budget = st.number_input("Budget", value=float(item.get('budget', 0.0)), format="%.2f")
+            item_currency = get_item_currency(item)
+            currencies = currency_options(get_fx_rates(), item_currency)
+            currency = st.selectbox("Budget Currency", currencies, index=currencies.index(item_currency))
+            warn_missing_rate(currency, get_fx_rates())
             notes = st.text_area("Notes", value=item['notes'])
             
             update_col, delete_col = st.columns(2)
             with update_col:
                 if st.button("Update Trip"):
-                    data = {"destination": destination, "start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "status": status, "budget": budget, "notes": notes}
+                    data = {"destination": destination, "start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "status": status, "budget": budget, "currency": currency, "notes": notes}
                     update_record("travel", item_id, data)
                     st.rerun()
             with delete_col:
@@ -682,6 +778,7 @@ def create_sidebar_nav():
     pages = {
         "Home": "🏠 Home",
         "Finances": "💰 Finances",
+        "Calendar": "📅 Calendar",
         "To-Do": "✅ To-Do",
         "Reminders": "⏰ Reminders",
         "Important Dates": "🗓️ Important Dates",
@@ -689,7 +786,7 @@ def create_sidebar_nav():
     }
     
     sub_pages = {
-        "Finances": ["Add Transaction", "Update / Delete", "View Summaries"],
+        "Finances": ["Add Transaction", "Update / Delete", "View Summaries", "Currency Rates"],
         "Reminders": ["View & Edit", "Add New"],
         "Important Dates": ["View & Edit", "Add New"],
         "Travel": ["View & Edit", "Add New"]
@@ -742,6 +839,8 @@ if page_key == "Home": page_home()
 elif page_key == "Finances_Add_Transaction": page_add_transaction()
 elif page_key == "Finances_Update_/_Delete": page_update_transaction()
 elif page_key == "Finances_View_Summaries": page_view_summary()
+elif page_key == "Finances_Currency_Rates": page_currency_rates()
+elif page_key == "Calendar": page_calendar()
 elif page_key == "To-Do": page_todo()
 elif page_key == "Reminders_View_&_Edit": page_view_reminders()
 elif page_key == "Reminders_Add_New": page_add_reminder()
@@ -0,0 +1,234 @@
+"""Headless quick-capture API and CLI for the Personal Hub.
+
+Adds transactions and to-dos or reads summary totals without starting a Streamlit
+session. Uses the same Supabase tables, CATEGORY_MAP validation and FX table as the app.
+
+Server (token from [api] token in .streamlit/secrets.toml or HUB_API_TOKEN):
+    python quick_capture.py serve --port 8765
+    curl -H "Authorization: Bearer $TOKEN" -d '{"person": "Ours", "type": "Expense",
+         "category": "Food", "sub_category": "Restaurant", "amount": 450}' localhost:8765/transactions
+
+CLI (talks to Supabase directly):
+    python quick_capture.py add-transaction --person Ours --category Food --sub-category Office 120
+    python quick_capture.py add-todo "Renew insurance" --due 2026-11-01 --for Manasa
+    python quick_capture.py summary --person Pramodh --currency USD
+"""
+import argparse
+import hmac
+import json
+import logging
+import os
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+from postgrest.exceptions import APIError
+
+from tracker_core import (
+    BASE_CURRENCY, PERSONS,
+    build_todo, build_transaction, create_supabase_client, fetch_table, insert_record,
+    fx_rates_version, load_fx_rates, load_secrets, missing_fx_rates, summarize_totals,
+)
+
+SUMMARY_COLUMNS = "person,type,amount,currency"
+MAX_BODY_BYTES = 64 * 1024
+SUPABASE_ERRORS = (APIError, httpx.HTTPError)
+
+logger = logging.getLogger("quick_capture")
+
+# -------------------------------
+# Operations shared by the API and CLI
+# -------------------------------
+_fx_cache = {}
+
+def get_fx_rates():
+    """Loads the FX table, re-reading the file only when it changes on disk."""
+    mtime = fx_rates_version()
+    if _fx_cache.get("mtime") != mtime or "rates" not in _fx_cache:
+        _fx_cache.update(mtime=mtime, rates=load_fx_rates())
+    return _fx_cache["rates"]
+
+def add_transaction(client, payload):
+    data = build_transaction(
+        payload.get("date"), payload.get("person"), payload.get("type", "Expense"),
+        payload.get("category"), payload.get("sub_category"), payload.get("description", ""),
+        payload.get("amount"), payload.get("currency"), get_fx_rates().index,
+    )
+    insert_record(client, "transactions", data)
+    return data
+
+def add_todo(client, payload):
+    data = build_todo(payload.get("item"), payload.get("due_date"), payload.get("assigned_user", "Ours"))
+    insert_record(client, "todos", data)
+    return data
+
+def get_summary(client, person=None, currency=BASE_CURRENCY):
+    if person is not None and person not in PERSONS:
+        raise ValueError(f"Person must be one of {', '.join(PERSONS)}.")
+    rates = get_fx_rates()
+    if currency not in rates.index:
+        raise ValueError(f"No FX rate for reporting currency {currency}.")
+    df = fetch_table(client, "transactions", columns=SUMMARY_COLUMNS)
+    if person is not None and not df.empty:
+        df = df[df["person"] == person]
+    return {
+        "person": person, "currency": currency,
+        **summarize_totals(df, rates, currency),
+        "missing_fx_rates": missing_fx_rates(df, rates),
+    }
+
+# -------------------------------
+# HTTP API
+# -------------------------------
+class QuickCaptureHandler(BaseHTTPRequestHandler):
+    client = None
+    token = None
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _authorized(self):
+        header = self.headers.get("Authorization", "")
+        supplied = header[len("Bearer "):] if header.startswith("Bearer ") else ""
+        if hmac.compare_digest(supplied.encode(), self.token.encode()):
+            return True
+        self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "Invalid or missing token."})
+        return False
+
+    def _handle(self, action, *args):
+        try:
+            return action(self.client, *args)
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except SUPABASE_ERRORS as e:
+            self._send_json(HTTPStatus.BAD_GATEWAY, {"error": f"Supabase request failed: {e}"})
+        except Exception:
+            logger.exception("Error handling %s %s", self.command, self.path)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."})
+        return None
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        actions = {"/transactions": add_transaction, "/todos": add_todo}
+        action = actions.get(urlparse(self.path).path)
+        if action is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length."})
+            return
+        if length > MAX_BODY_BYTES:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": f"Body must be at most {MAX_BODY_BYTES} bytes."})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Body must be JSON."})
+            return
+        if not isinstance(payload, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Body must be a JSON object."})
+            return
+        record = self._handle(action, payload)
+        if record is not None:
+            self._send_json(HTTPStatus.CREATED, {"record": record})
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        url = urlparse(self.path)
+        if url.path != "/summary":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        summary = self._handle(get_summary, query.get("person"), query.get("currency", BASE_CURRENCY).upper())
+        if summary is not None:
+            self._send_json(HTTPStatus.OK, summary)
+
+def get_api_token(secrets):
+    return os.environ.get("HUB_API_TOKEN", secrets.get("api", {}).get("token"))
+
+def serve(client, token, host, port):
+    QuickCaptureHandler.client = client
+    QuickCaptureHandler.token = token
+    server = ThreadingHTTPServer((host, port), QuickCaptureHandler)
+    print(f"Quick-capture API listening on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+# -------------------------------
+# CLI
+# -------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick-capture API and CLI for the Personal Hub.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the HTTP API")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+
+    txn = commands.add_parser("add-transaction", help="Add a transaction")
+    txn.add_argument("amount")
+    txn.add_argument("--person", required=True, choices=PERSONS)
+    txn.add_argument("--type", default="Expense")
+    txn.add_argument("--category", required=True)
+    txn.add_argument("--sub-category")
+    txn.add_argument("--description", default="")
+    txn.add_argument("--currency")
+    txn.add_argument("--date", help="YYYY-MM-DD, defaults to today")
+
+    todo = commands.add_parser("add-todo", help="Add a to-do item")
+    todo.add_argument("item")
+    todo.add_argument("--due", help="YYYY-MM-DD")
+    todo.add_argument("--for", dest="assigned_user", default="Ours", choices=PERSONS)
+
+    summary = commands.add_parser("summary", help="Print income, expense and balance")
+    summary.add_argument("--person", choices=PERSONS)
+    summary.add_argument("--currency", default=BASE_CURRENCY)
+
+    args = parser.parse_args(argv)
+    secrets = load_secrets()
+    try:
+        client = create_supabase_client(secrets)
+    except KeyError as e:
+        sys.exit(f"Error: {e.args[0]} Set [supabase] url/key in secrets or SUPABASE_URL/SUPABASE_KEY.")
+
+    if args.command == "serve":
+        token = get_api_token(secrets)
+        if not token:
+            parser.error("No API token: set [api] token in secrets or HUB_API_TOKEN.")
+        serve(client, token, args.host, args.port)
+        return
+
+    try:
+        if args.command == "add-transaction":
+            result = add_transaction(client, {
+                "date": args.date, "person": args.person, "type": args.type,
+                "category": args.category, "sub_category": args.sub_category,
+                "description": args.description, "amount": args.amount, "currency": args.currency,
+            })
+        elif args.command == "add-todo":
+            result = add_todo(client, {"item": args.item, "due_date": args.due, "assigned_user": args.assigned_user})
+        else:
+            result = get_summary(client, args.person, args.currency.upper())
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+    except SUPABASE_ERRORS as e:
+        sys.exit(f"Error: Supabase request failed: {e}")
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Headless dispatcher for reminder, to-do and important-date notifications.
+
+Keeps a min-heap of upcoming reminder_date, due_date and impdates anniversaries,
+sleeps until the earliest one is due (or the next refresh), and hands each item
+to a notification channel. Refreshes only fetch rows created since the last one;
+edits and deletes are picked up by a less frequent full resync because the tables
+have no `updated_at` column. Delivered items are recorded in a small JSON file so
+restarts don't re-send them.
+
+Local testing with a debug SMTP server:
+    pip install aiosmtpd && python -m aiosmtpd -n -l localhost:8025
+    python reminder_dispatcher.py --channel smtp --smtp-port 8025 --to you@example.com
+"""
+import argparse
+import datetime
+import heapq
+import itertools
+import json
+import logging
+import os
+import smtplib
+import time
+from email.message import EmailMessage
+
+import pandas as pd
+
+from tracker_core import APP_DIR, create_supabase_client, fetch_table, load_secrets, next_anniversary
+
+logger = logging.getLogger("reminder_dispatcher")
+
+# -------------------------------
+# Notification Channels
+# -------------------------------
+class NotificationChannel:
+    """Base class for delivery channels; subclasses implement `send`."""
+
+    def send(self, notification):
+        raise NotImplementedError
+
+class ConsoleChannel(NotificationChannel):
+    def send(self, notification):
+        print(f"[{notification['date']}] {notification['subject']}\n{notification['body']}\n", flush=True)
+
+class SMTPChannel(NotificationChannel):
+    def __init__(self, host, port, sender, recipients, username=None, password=None, use_tls=False):
+        self.host, self.port = host, port
+        self.sender, self.recipients = sender, recipients
+        self.username, self.password = username, password
+        self.use_tls = use_tls
+
+    def send(self, notification):
+        msg = EmailMessage()
+        msg["Subject"] = notification["subject"]
+        msg["From"] = self.sender
+        msg["To"] = ", ".join(self.recipients)
+        msg.set_content(notification["body"])
+        with smtplib.SMTP(self.host, self.port) as server:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+            server.send_message(msg)
+
+# -------------------------------
+# Schedule Sources
+# -------------------------------
+def _text(value):
+    return "" if pd.isnull(value) else str(value)
+
+def reminder_items(df, today):
+    for _, row in df.iterrows():
+        if pd.isnull(row['reminder_date']) or row['reminder_date'] < today:
+            continue
+        yield ("reminders", row['id']), row['reminder_date'], {
+            "subject": f"⏰ Reminder: {row['title']}",
+            "body": f"For: {row['assigned_user']}\n{_text(row.get('details'))}".strip(),
+        }
+
+def todo_items(df, today):
+    for _, row in df.iterrows():
+        if row['is_complete'] == True or pd.isnull(row['due_date']) or row['due_date'] < today:
+            continue
+        yield ("todos", row['id']), row['due_date'], {
+            "subject": f"✅ To-Do due: {row['item']}",
+            "body": f"Assigned to: {row['assigned_user']}",
+        }
+
+def impdate_items(df, today):
+    for _, row in df.iterrows():
+        if pd.isnull(row['event_date']):
+            continue
+        yield ("impdates", row['id']), next_anniversary(row['event_date'], today), {
+            "subject": f"🗓️ {row['event_name']} ({row['category']})",
+            "body": f"Since {row['event_date'].isoformat()}\n{_text(row.get('notes'))}".strip(),
+            "event_date": row['event_date'],
+        }
+
+# table -> (item generator, columns it reads)
+SOURCES = {
+    "reminders": (reminder_items, "id,title,reminder_date,assigned_user,details,created_at"),
+    "todos": (todo_items, "id,item,due_date,assigned_user,is_complete,created_at"),
+    "impdates": (impdate_items, "id,event_name,event_date,category,notes,created_at"),
+}
+STATE_PATH = os.path.join(APP_DIR, ".dispatcher_state.json")
+
+# -------------------------------
+# Dispatcher
+# -------------------------------
+class ReminderDispatcher:
+    """Time-ordered index of pending notifications backed by a min-heap.
+
+    Heap entries are (due_at, seq, key). Rescheduled or removed records leave their
+    old heap entries behind; these are skipped on pop because they no longer match
+    `self.scheduled[key]`.
+    """
+
+    def __init__(self, client, channel, notify_time=datetime.time(8, 0), refresh_interval=300,
+                 resync_interval=3600, state_path=STATE_PATH):
+        self.client = client
+        self.channel = channel
+        self.notify_time = notify_time
+        self.refresh_interval = refresh_interval
+        self.resync_interval = resync_interval
+        self.state_path = state_path
+        self.heap = []
+        self.scheduled = {}  # key -> (due_at, notification)
+        self.watermarks = {}  # table -> newest created_at seen
+        self.delivered = self._load_delivered()  # (table, id, iso date) already sent
+        self._seq = itertools.count()
+
+    # --- Delivered log ---
+    @staticmethod
+    def _delivery_key(key, date):
+        return key[0], str(key[1]), date.isoformat()
+
+    def _load_delivered(self):
+        try:
+            with open(self.state_path) as f:
+                return {tuple(entry) for entry in json.load(f)}
+        except FileNotFoundError:
+            return set()
+        except (ValueError, TypeError) as e:
+            logger.error("Ignoring unreadable dispatcher state %s: %s", self.state_path, e)
+            return set()
+
+    def _save_delivered(self):
+        # Anything dated before today can't be scheduled again, so drop it
+        today = datetime.date.today().isoformat()
+        self.delivered = {entry for entry in self.delivered if entry[2] >= today}
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(sorted(self.delivered), f)
+        os.replace(tmp_path, self.state_path)
+
+    # --- Index maintenance ---
+    def schedule(self, key, date, notification):
+        if self._delivery_key(key, date) in self.delivered:
+            return
+        due_at = datetime.datetime.combine(date, self.notify_time)
+        current = self.scheduled.get(key)
+        notification = {**notification, "date": date}
+        if current is not None and current == (due_at, notification):
+            return
+        self.scheduled[key] = (due_at, notification)
+        heapq.heappush(self.heap, (due_at, next(self._seq), key))
+
+    def refresh(self, today=None, full=False):
+        """Adds rows created since the last refresh; `full` re-reads everything to catch edits and deletes."""
+        today = today or datetime.date.today()
+        for table_name, (items, columns) in SOURCES.items():
+            created_after = None if full else self.watermarks.get(table_name)
+            try:
+                df = fetch_table(self.client, table_name, columns=columns, created_after=created_after)
+            except Exception as e:
+                logger.error("Error fetching data from %s: %s", table_name, e)
+                continue
+            seen = set()
+            if not df.empty:
+                self.watermarks[table_name] = max(self.watermarks.get(table_name, ""), df["created_at"].max())
+                for key, date, notification in items(df, today):
+                    seen.add(key)
+                    self.schedule(key, date, notification)
+            if full:
+                for key in [k for k in self.scheduled if k[0] == table_name and k not in seen]:
+                    del self.scheduled[key]
+
+    def next_due(self):
+        """Returns the earliest live due time, discarding stale heap entries."""
+        while self.heap:
+            due_at, _, key = self.heap[0]
+            current = self.scheduled.get(key)
+            if current is not None and current[0] == due_at:
+                return due_at
+            heapq.heappop(self.heap)
+        return None
+
+    def dispatch_due(self, now=None):
+        """Delivers every notification due at or before `now`; returns how many were sent."""
+        now = now or datetime.datetime.now()
+        sent = 0
+        while (due_at := self.next_due()) is not None and due_at <= now:
+            _, _, key = heapq.heappop(self.heap)
+            _, notification = self.scheduled.pop(key)
+            try:
+                self.channel.send(notification)
+            except Exception as e:
+                logger.error("Error sending notification %s: %s", key, e)
+                continue
+            sent += 1
+            self.delivered.add(self._delivery_key(key, notification["date"]))
+            if key[0] == "impdates":
+                # Anniversaries recur: queue next year's occurrence straight away
+                following = notification["date"] + datetime.timedelta(days=1)
+                self.schedule(key, next_anniversary(notification["event_date"], following), notification)
+        if sent:
+            self._save_delivered()
+        return sent
+
+    def run_forever(self):
+        next_refresh = next_resync = time.monotonic()
+        while True:
+            if time.monotonic() >= next_refresh:
+                full = time.monotonic() >= next_resync
+                self.refresh(full=full)
+                next_refresh = time.monotonic() + self.refresh_interval
+                if full:
+                    next_resync = time.monotonic() + self.resync_interval
+            self.dispatch_due()
+
+            wait = next_refresh - time.monotonic()
+            due_at = self.next_due()
+            if due_at is not None:
+                wait = min(wait, (due_at - datetime.datetime.now()).total_seconds())
+            time.sleep(max(wait, 0))
+
+# -------------------------------
+# Entry Point
+# -------------------------------
+def build_channel(args, secrets):
+    if args.channel == "console":
+        return ConsoleChannel()
+    smtp = secrets.get("smtp", {})
+    recipients = args.to or smtp.get("recipients", [])
+    if not recipients:
+        raise SystemExit("No recipients: pass --to or set [smtp] recipients in secrets.")
+    return SMTPChannel(
+        host=args.smtp_host or smtp.get("host", "localhost"),
+        port=args.smtp_port or smtp.get("port", 25),
+        sender=smtp.get("sender", "personal-hub@localhost"),
+        recipients=recipients,
+        username=smtp.get("username"),
+        password=smtp.get("password"),
+        use_tls=smtp.get("use_tls", False),
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send reminder, to-do and important-date notifications.")
+    parser.add_argument("--channel", choices=["console", "smtp"], default="console")
+    parser.add_argument("--smtp-host")
+    parser.add_argument("--smtp-port", type=int)
+    parser.add_argument("--to", action="append", help="Recipient address (repeatable)")
+    parser.add_argument("--notify-time", default="08:00", help="Local time of day to send, HH:MM")
+    parser.add_argument("--refresh", type=int, default=300, help="Seconds between checks for new rows")
+    parser.add_argument("--resync", type=int, default=3600, help="Seconds between full re-reads for edits and deletes")
+    parser.add_argument("--state", default=STATE_PATH, help="JSON file recording delivered notifications")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    secrets = load_secrets()
+    try:
+        client = create_supabase_client(secrets)
+    except KeyError as e:
+        raise SystemExit(f"Error: {e.args[0]} Set [supabase] url/key in secrets or SUPABASE_URL/SUPABASE_KEY.")
+    dispatcher = ReminderDispatcher(
+        client,
+        build_channel(args, secrets),
+        notify_time=datetime.time.fromisoformat(args.notify_time),
+        refresh_interval=args.refresh,
+        resync_interval=args.resync,
+        state_path=args.state,
+    )
+    try:
+        dispatcher.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+import os
+import datetime
+import calendar
+import functools
+import math
+import tomllib
+import numpy as np
+import pandas as pd
+from babel import Locale, numbers
+from supabase import create_client, Client
+
+# -------------------------------
+# Shared data layer for the Streamlit app and headless tools
+# -------------------------------
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SECRETS_PATH = os.path.join(APP_DIR, ".streamlit", "secrets.toml")
+DATE_COLUMNS = ['date', 'due_date', 'reminder_date', 'event_date', 'start_date', 'end_date']
+
+def load_secrets(path=SECRETS_PATH):
+    """Reads the Streamlit secrets file so scripts outside Streamlit share its config."""
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+
+def create_supabase_client(secrets=None) -> Client:
+    """Creates a Supabase client from secrets, falling back to SUPABASE_URL / SUPABASE_KEY."""
+    secrets = load_secrets() if secrets is None else secrets
+    supabase_secrets = secrets.get("supabase", {})
+    url = os.environ.get("SUPABASE_URL", supabase_secrets.get("url"))
+    key = os.environ.get("SUPABASE_KEY", supabase_secrets.get("key"))
+    if not url or not key:
+        raise KeyError("Supabase credentials not found.")
+    return create_client(url, key)
+
+def fetch_table(client, table_name, columns="*", created_after=None):
+    """Fetches a table, newest first, with date columns parsed to `datetime.date`.
+
+    With `created_after`, only rows whose `created_at` is later are returned.
+    """
+    query = client.table(table_name).select(columns)
+    if created_after is not None:
+        query = query.gt("created_at", created_after)
+    response = query.order("created_at", desc=True).execute()
+    df = pd.DataFrame(response.data)
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce').dt.date
+    return df
+
+def insert_record(client, table_name, data_dict):
+    return client.table(table_name).insert(data_dict).execute()
+
+# -------------------------------
+# Category Mapping (for Finances)
+# -------------------------------
+PERSONS = ["Pramodh", "Manasa", "Ours"]
+CATEGORY_MAP = {
+    "Income": {"Salary": ["-"], "Returns": ["-"], "Others": ["-"]},
+    "Expense": {
+        "Deductions": ["Home Loan", "Interiors Loan", "Home Insurance", "Others"],
+        "Entertainment": ["Movies", "Music", "Others"], "Investments": ["Stock", "Mutual Funds", "NPS", "Gold", "Others"],
+        "Savings": ["Emergency Fund", "Short-Vacation", "Long-Vacation", "Dates"],
+        "Insurance": ["Health", "Bike", "Car", "Home", "Others"], "Groceries": ["Instamart", "Offline", "Others"],
+        "Shopping": ["Clothes", "Electronics", "Others"],
+        "Bills": ["Rent", "Mobile", "Internet", "Electricity", "Gas", "Home Maintenance", "Credit Card", "Others"],
+        "Travel": ["Petrol", "Cab", "Others"], "Vacation": ["Travel", "Food", "Accomomdation", "Others"],
+        "Medical": ["Pharmacy", "Tests", "Others"],"Food": ["Restaurant", "Home Delivery", "Office", "Others"],
+        "Others": ["-"],
+    },
+}
+
+def _parse_date(value, label):
+    if value is None or isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"{label} must be a date in YYYY-MM-DD format.")
+
+def _parse_text(value, label, required=False):
+    if value is None:
+        value = ""
+    if not isinstance(value, str):
+        raise ValueError(f"{label} must be text.")
+    if required and not value.strip():
+        raise ValueError(f"{label} is required.")
+    return value
+
+def build_transaction(date, person, ttype, category, subcategory, description, amount, currency=None, currencies=None):
+    """Validates a transaction against CATEGORY_MAP and returns the row to insert.
+
+    `currencies` are the accepted currency codes, by default those in the FX table.
+    Raises ValueError with a user-facing message when the input is invalid.
+    """
+    date = _parse_date(date, "Date") or datetime.date.today()
+    if person not in PERSONS:
+        raise ValueError(f"Person must be one of {', '.join(PERSONS)}.")
+    if not isinstance(ttype, str) or ttype not in CATEGORY_MAP:
+        raise ValueError(f"Type must be one of {', '.join(CATEGORY_MAP)}.")
+    if not isinstance(category, str) or category not in CATEGORY_MAP[ttype]:
+        raise ValueError(f"Unknown {ttype} category '{category}'.")
+    description = _parse_text(description, "Description")
+
+    if category == "Others":
+        if not description:
+            raise ValueError("Description is mandatory when 'Others' category is selected.")
+        subcategory = description
+    else:
+        subcategories = CATEGORY_MAP[ttype][category]
+        if subcategory is None and len(subcategories) == 1:
+            subcategory = subcategories[0]
+        if subcategory not in subcategories:
+            raise ValueError(f"Sub-category for {category} must be one of {', '.join(subcategories)}.")
+
+    try:
+        if isinstance(amount, bool):
+            raise TypeError
+        amount = float(amount)
+    except (ValueError, TypeError):
+        raise ValueError("Amount must be a number.")
+    if not math.isfinite(amount):
+        raise ValueError("Amount must be a finite number.")
+    if not amount > 0:
+        raise ValueError("Amount must be greater than zero.")
+
+    currency = _parse_text(currency, "Currency").upper() or BASE_CURRENCY
+    currencies = load_fx_rates().index if currencies is None else currencies
+    if currency not in currencies:
+        raise ValueError(f"No FX rate for {currency}; import one on the Currency Rates page first.")
+
+    return {
+        "date": date.isoformat(), "person": person, "type": ttype,
+        "category": category, "sub_category": subcategory,
+        "description": description, "amount": round(amount, 2), "currency": currency
+    }
+
+def build_todo(item, due_date, assigned_user):
+    """Validates a to-do item and returns the row to insert."""
+    item = _parse_text(item, "To-Do item", required=True)
+    if assigned_user not in PERSONS:
+        raise ValueError(f"Assigned user must be one of {', '.join(PERSONS)}.")
+    due_date = _parse_date(due_date, "Due date")
+    return {"item": item, "due_date": due_date.isoformat() if due_date else None, "assigned_user": assigned_user}
+
+# -------------------------------
+# Currencies & FX Rates
+# -------------------------------
+BASE_CURRENCY = "INR"  # Currency of rows with a NULL `currency` and unit of the FX table
+DISPLAY_LOCALE = "en_IN"
+FX_RATES_PATH = os.path.join(APP_DIR, "fx_rates.csv")  # Imported rates; untracked
+FX_RATES_SEED_PATH = os.path.join(APP_DIR, "fx_rates.default.csv")
+
+def _fx_rates_source(path):
+    """The imported table if there is one, else the committed seed."""
+    return path if os.path.exists(path) else FX_RATES_SEED_PATH
+
+def load_fx_rates(path=FX_RATES_PATH):
+    """Loads the local FX table as a Series of BASE_CURRENCY per unit, indexed by currency code."""
+    try:
+        df = pd.read_csv(_fx_rates_source(path))
+    except FileNotFoundError:
+        df = pd.DataFrame({"currency": pd.Series(dtype=str), "rate": pd.Series(dtype=float)})
+    rates = pd.Series(pd.to_numeric(df["rate"], errors="coerce").values,
+                      index=df["currency"].astype(str).str.strip().str.upper(), name="rate")
+    # A hand-edited file may repeat a code or hold unusable rates; drop rather than crash later
+    rates = rates[~rates.index.duplicated(keep="last")]
+    rates = rates[rates.notna() & np.isfinite(rates) & (rates > 0)]
+    rates[BASE_CURRENCY] = 1.0
+    return rates
+
+def fx_rates_version(path=FX_RATES_PATH):
+    """Modification time of the FX table, for keying caches derived from it."""
+    try:
+        return os.path.getmtime(_fx_rates_source(path))
+    except OSError:
+        return None
+
+def import_fx_rates(source, path=FX_RATES_PATH):
+    """Merges `currency,rate` rows from a CSV path or file object into the local FX table."""
+    new = pd.read_csv(source)
+    missing = {"currency", "rate"} - set(new.columns)
+    if missing:
+        raise ValueError(f"FX file is missing columns: {', '.join(sorted(missing))}")
+    new_rates = pd.Series(pd.to_numeric(new["rate"], errors="coerce").values,
+                          index=new["currency"].astype(str).str.strip().str.upper())
+    if new_rates.isna().any() or (new_rates <= 0).any():
+        raise ValueError("FX rates must be positive numbers.")
+    duplicated = sorted(set(new_rates.index[new_rates.index.duplicated()]))
+    if duplicated:
+        raise ValueError(f"FX file lists these currencies more than once: {', '.join(duplicated)}")
+
+    rates = load_fx_rates(path)
+    rates = pd.concat([rates.drop(new_rates.index, errors="ignore"), new_rates])
+    rates[BASE_CURRENCY] = 1.0
+    rates.sort_index().rename_axis("currency").rename("rate").to_csv(path)
+    return rates
+
+def missing_fx_rates(df, rates):
+    """Returns the currencies used in `df` that have no rate in the FX table."""
+    if df.empty:
+        return []
+    return sorted(set(df["currency"].dropna()) - set(rates.index))
+
+def reporting_amounts(df, rates, reporting_currency=BASE_CURRENCY):
+    """Converts `df['amount']` to `reporting_currency` in one vectorized pass.
+
+    Rows whose currency has no rate come back as NaN; see `missing_fx_rates`.
+    """
+    amounts = pd.to_numeric(df["amount"])
+    currencies = df["currency"].fillna(BASE_CURRENCY)
+    return amounts * currencies.map(rates) / rates.get(reporting_currency, float("nan"))
+
+def summarize_totals(df, rates, reporting_currency=BASE_CURRENCY):
+    """Income, expense and balance of `df` in `reporting_currency`."""
+    if df.empty:
+        return {"income": 0.0, "expense": 0.0, "balance": 0.0, "transactions": 0}
+    amounts = reporting_amounts(df, rates, reporting_currency)
+    income = float(amounts[df["type"] == "Income"].sum())
+    expense = float(amounts[df["type"] == "Expense"].sum())
+    return {"income": income, "expense": expense, "balance": income - expense, "transactions": len(df)}
+
+# -------------------------------
+# Formatting Functions
+# -------------------------------
+@functools.lru_cache(maxsize=None)
+def _currency_format(currency, locale):
+    """Resolves the babel currency pattern pieces for (currency, locale) once."""
+    pattern = numbers.parse_pattern(Locale.parse(locale).currency_formats['standard'])
+    symbol = numbers.get_currency_symbol(currency, locale)
+    prefixes = tuple(p.replace("¤", symbol) for p in pattern.prefix)
+    suffixes = tuple(p.replace("¤", symbol) for p in pattern.suffix)
+    primary, secondary = pattern.grouping
+    group_regex = rf"(\d)(?=(?:\d{{{secondary}}})*\d{{{primary}}}$)"
+    return prefixes, suffixes, group_regex, numbers.get_group_symbol(locale), numbers.get_decimal_symbol(locale)
+
+def format_amounts(amounts, currency=BASE_CURRENCY, locale=DISPLAY_LOCALE, decimals=1):
+    """Formats a Series of amounts in one currency with the locale's currency pattern.
+
+    Babel is consulted once per (currency, locale); the digits, grouping and signs
+    are then applied with column-wise pandas string operations.
+    """
+    prefixes, suffixes, group_regex, group_symbol, decimal_symbol = _currency_format(currency, locale)
+    amounts = pd.to_numeric(amounts).astype(float)
+    amounts = amounts.where(np.isfinite(amounts))  # inf (e.g. a zero rate) formats like NaN
+    scale = 10 ** decimals
+    units = (amounts.abs().fillna(0) * scale).round().astype("int64")
+
+    text = (units // scale).astype(str).str.replace(group_regex, rf"\1{group_symbol}", regex=True)
+    if decimals:
+        text = text + decimal_symbol + (units % scale).astype(str).str.zfill(decimals)
+
+    negative = (amounts < 0) & (units > 0)
+    text = negative.map({True: prefixes[1], False: prefixes[0]}) + text + negative.map({True: suffixes[1], False: suffixes[0]})
+    return text.where(amounts.notna())
+
+def format_amount(amount, currency=BASE_CURRENCY, locale=DISPLAY_LOCALE):
+    return format_amounts(pd.Series([amount]), currency, locale).iloc[0]
+
+# -------------------------------
+# Date Helpers
+# -------------------------------
+def get_relativedelta_text(start_date, end_date):
+    """Calculates years, months, days between two dates and returns a formatted string."""
+    if start_date > end_date:
+        return "In the past"
+
+    years = end_date.year - start_date.year
+    months = end_date.month - start_date.month
+    days = end_date.day - start_date.day
+
+    if days < 0:
+        months -= 1
+        prev_month_year = end_date.year if end_date.month > 1 else end_date.year - 1
+        prev_month = end_date.month - 1 if end_date.month > 1 else 12
+        days += calendar.monthrange(prev_month_year, prev_month)[1]
+
+    if months < 0:
+        years -= 1
+        months += 12
+
+    parts = []
+    if years > 0: parts.append(f"{years}y")
+    if months > 0: parts.append(f"{months}m")
+    if days > 0 or not parts: parts.append(f"{days}d")
+
+    return ", ".join(parts)
+
+def anniversary_in_year(event_date, year):
+    """Returns the anniversary of `event_date` in `year` (Feb 29 falls on Feb 28 in non-leap years)."""
+    try:
+        return event_date.replace(year=year)
+    except ValueError:
+        return datetime.date(year, 2, 28)
+
+def next_anniversary(event_date, today):
+    """Returns the first anniversary of `event_date` on or after `today`.
+
+    An event that hasn't happened yet has no earlier anniversary than itself.
+    """
+    if event_date >= today:
+        return event_date
+    next_occurrence_year = today.year
+    if (today.month, today.day) > (event_date.month, event_date.day):
+        next_occurrence_year += 1
+    return anniversary_in_year(event_date, next_occurrence_year)
+
+def calculate_anniversary_details(event_date):
+    """Calculates age and time to next anniversary for a given date."""
+    if pd.isnull(event_date):
+        return None, None
+
+    today = datetime.date.today()
+    if not isinstance(event_date, datetime.date):
+        event_date = pd.to_datetime(event_date).date()
+
+    # 1. Time passed since original event
+    time_passed_str = get_relativedelta_text(event_date, today)
+
+    # 2. Find next occurrence
+    next_event_date = next_anniversary(event_date, today)
+
+    # 3. Time until next occurrence
+    if next_event_date == today:
+        time_to_next_str = "🎉 Today!"
+    else:
+        time_to_next_str = get_relativedelta_text(today, next_event_date)
+
+    return time_passed_str, time_to_next_str
+
+# -------------------------------
+# Calendar Index
+# -------------------------------
+CALENDAR_TABLES = ["transactions", "todos", "reminders", "impdates", "travel"]
+CALENDAR_COLUMNS = ["start", "end", "source", "title", "detail", "recurring"]
+
+def _calendar_frame(df, start_col, end_col, source, title, detail, recurring=False):
+    df = df[df[start_col].notna()]
+    end = df[end_col].fillna(df[start_col]) if end_col else df[start_col]
+    return pd.DataFrame({
+        "start": df[start_col],
+        "end": end.where(end >= df[start_col], df[start_col]),  # a reversed trip counts as its start day
+        "source": source,
+        "title": title(df) if len(df) else pd.Series(dtype=str),
+        "detail": detail(df) if len(df) else pd.Series(dtype=str),
+        "recurring": recurring,
+    }, columns=CALENDAR_COLUMNS)
+
+def calendar_events(tables):
+    """Flattens the dated tables into one frame of start/end events for DateIntervalIndex."""
+    builders = {
+        "transactions": lambda df: _calendar_frame(
+            df, "date", None, "💰 Transaction",
+            lambda d: d["category"] + " · " + d["sub_category"].fillna("-"),
+            lambda d: d["type"] + " " + d["amount"].astype(str) + " " + d["currency"].fillna(BASE_CURRENCY)),
+        "todos": lambda df: _calendar_frame(
+            df, "due_date", None, "✅ To-Do",
+            lambda d: d["item"],
+            lambda d: d["assigned_user"] + d["is_complete"].map({True: " · done"}).fillna("")),
+        "reminders": lambda df: _calendar_frame(
+            df, "reminder_date", None, "⏰ Reminder",
+            lambda d: d["title"], lambda d: d["assigned_user"]),
+        "impdates": lambda df: _calendar_frame(
+            df, "event_date", None, "🗓️ Important Date",
+            lambda d: d["event_name"], lambda d: d["category"], recurring=True),
+        "travel": lambda df: _calendar_frame(
+            df, "start_date", "end_date", "✈️ Travel",
+            lambda d: d["destination"], lambda d: d["status"]),
+    }
+    frames = [builders[name](df) for name, df in tables.items() if name in builders and not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=CALENDAR_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+class DateIntervalIndex:
+    """Answers "which events touch [start, end]?" with binary searches instead of full scans.
+
+    Single-day events (transactions, to-dos, reminders) are sorted by day and
+    searched over [start, end] only. Multi-day events (trips) are kept apart,
+    sorted by start; since none is longer than their own `max_span`, only those
+    starting in [start - max_span, end] can overlap the window, so one long trip
+    never widens the search over single-day events. Recurring events
+    (anniversaries) are sorted by (month, day) and looked up once per calendar
+    year the window covers.
+    """
+
+    def __init__(self, events):
+        one_off = events[~events["recurring"].astype(bool)]
+        starts = np.array([d.toordinal() for d in one_off["start"]], dtype=np.int64)
+        ends = np.maximum(np.array([d.toordinal() for d in one_off["end"]], dtype=np.int64), starts)
+
+        single = ends == starts
+        order = np.argsort(starts[single], kind="stable")
+        self.days = one_off[single].iloc[order].reset_index(drop=True)
+        self.day_ordinals = starts[single][order]
+
+        order = np.argsort(starts[~single], kind="stable")
+        self.spans = one_off[~single].iloc[order].reset_index(drop=True)
+        self.span_starts, self.span_ends = starts[~single][order], ends[~single][order]
+        self.max_span = int((self.span_ends - self.span_starts).max()) if len(self.span_starts) else 0
+
+        recurring = events[events["recurring"].astype(bool)]
+        keys = np.array([d.month * 100 + d.day for d in recurring["start"]], dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        self.recurring = recurring.iloc[order].reset_index(drop=True)
+        self.recurring_keys = keys[order]
+
+    def _one_off(self, start, end):
+        lo = np.searchsorted(self.day_ordinals, start.toordinal(), side="left")
+        hi = np.searchsorted(self.day_ordinals, end.toordinal(), side="right")
+        days = self.days.iloc[lo:hi]
+
+        lo = np.searchsorted(self.span_starts, start.toordinal() - self.max_span, side="left")
+        hi = np.searchsorted(self.span_starts, end.toordinal(), side="right")
+        hits = lo + np.flatnonzero(self.span_ends[lo:hi] >= start.toordinal())
+        return [days, self.spans.iloc[hits]]
+
+    def _recurring(self, start, end):
+        frames = []
+        for year in range(start.year, end.year + 1):
+            lo = max(start, datetime.date(year, 1, 1))
+            hi = min(end, datetime.date(year, 12, 31))
+            hi_key = hi.month * 100 + hi.day
+            if not calendar.isleap(year) and hi_key == 228:
+                hi_key = 229  # Feb 29 anniversaries fall on Feb 28
+            i = np.searchsorted(self.recurring_keys, lo.month * 100 + lo.day, side="left")
+            j = np.searchsorted(self.recurring_keys, hi_key, side="right")
+            hits = self.recurring.iloc[i:j]
+            hits = hits[[d.year <= year for d in hits["start"]]]
+            if not hits.empty:
+                occurrence = [anniversary_in_year(d, year) for d in hits["start"]]
+                frames.append(hits.assign(start=occurrence, end=occurrence))
+        return frames
+
+    def query(self, start, end):
+        """Returns the events overlapping [start, end], with anniversaries placed in that window."""
+        frames = self._one_off(start, end) + self._recurring(start, end)
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=CALENDAR_COLUMNS)
+        return pd.concat(frames, ignore_index=True).sort_values(["start", "source"], ignore_index=True)